@@ -1,13 +1,16 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify
 from flask_cors import CORS
 from data_manager import DataManager
 from scheduler import scheduler
+from static_assets import StaticAssets
 import os
 import logging
 
-app = Flask(__name__, static_folder='.')
+# Flask's built-in static handler is disabled; StaticAssets serves an explicit manifest
+app = Flask(__name__, static_folder=None)
 CORS(app)  # Enable CORS for all routes
 data_manager = DataManager()
+static_assets = StaticAssets(os.path.dirname(os.path.abspath(__file__)))
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -27,24 +30,20 @@ def page_not_found(e):
 
 @app.route('/')
 def serve_index():
-    return send_from_directory('.', 'index.html')
+    return static_assets.response('index.html')
 
-# Serve specific static files only (not a catch-all)
+# Serve only the files listed in the static asset manifest (not a catch-all)
 @app.route('/<path:filename>.js')
 @app.route('/<path:filename>.css')
 @app.route('/<path:filename>.html')
-@app.route('/<path:filename>.json')
-@app.route('/<path:filename>.png')
-@app.route('/<path:filename>.jpg')
-@app.route('/<path:filename>.ico')
 def serve_static_file(filename):
-    """Serve static files with known extensions"""
+    """Serve manifest assets from memory with ETag / Cache-Control headers"""
     # The route decorator strips the extension, so we need to get the full path
     # request.path starts with '/', so we strip it to get the relative filename
     full_filename = request.path.lstrip('/')
-    
-    if os.path.exists(full_filename):
-        return send_from_directory('.', full_filename)
+
+    if static_assets.has(full_filename):
+        return static_assets.response(full_filename)
     return jsonify({"error": "File not found", "path": full_filename}), 404
 
 
@@ -0,0 +1,165 @@
+import gzip
+import hashlib
+import os
+import re
+
+from flask import Response, request
+
+try:
+    import brotli  # Optional: only used if installed
+except ImportError:
+    brotli = None
+
+# Only these files are ever served to the browser. Anything else in the
+# working directory (data.json, .env, *.py) stays private.
+ASSET_MANIFEST = {
+    'index.html': 'text/html; charset=utf-8',
+    'app.js': 'application/javascript; charset=utf-8',
+    'style.css': 'text/css; charset=utf-8',
+}
+
+# The page that references the other assets. It is served un-fingerprinted
+# and always revalidated, so new deploys are picked up straight away.
+ENTRY_POINT = 'index.html'
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE = 'no-cache'
+
+# Compressing tiny files costs more than it saves
+MIN_COMPRESS_SIZE = 512
+
+
+class StaticAsset:
+    """One manifest file, with its hash and precompressed variants held in memory."""
+
+    def __init__(self, name, body, mimetype):
+        self.name = name
+        self.mimetype = mimetype
+        self.digest = hashlib.sha256(body).hexdigest()[:12]
+        self.variants = {'identity': body}
+
+        if len(body) >= MIN_COMPRESS_SIZE:
+            gz = gzip.compress(body, compresslevel=9, mtime=0)
+            if len(gz) < len(body):
+                self.variants['gzip'] = gz
+            if brotli is not None:
+                br = brotli.compress(body, quality=11)
+                if len(br) < len(body):
+                    self.variants['br'] = br
+
+    @property
+    def fingerprinted_name(self):
+        """e.g. app.js -> app.3f2a9c81d0be.js"""
+        stem, ext = os.path.splitext(self.name)
+        return f"{stem}.{self.digest}{ext}"
+
+    def etag_for(self, encoding):
+        # Each encoding is a different byte stream, so it needs its own strong ETag
+        if encoding == 'identity':
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def choose_encoding(self, accept_encoding):
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and _accepts(accept_encoding, encoding):
+                return encoding
+        return 'identity'
+
+
+def _accepts(accept_encoding, encoding):
+    """Check an Accept-Encoding header for an encoding, honouring q=0."""
+    for part in accept_encoding.split(','):
+        token, _, params = part.strip().partition(';')
+        if token.strip().lower() != encoding:
+            continue
+        match = re.search(r'q\s*=\s*([0-9.]+)', params)
+        if match:
+            try:
+                return float(match.group(1)) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class StaticAssets:
+    """
+    Loads the asset manifest once at startup: hashes every file, builds
+    gzip/brotli variants and rewrites index.html to point at the
+    fingerprinted URLs. Requests are then answered entirely from memory.
+    """
+
+    def __init__(self, root='.'):
+        self.root = root
+        self.assets = {}        # request path -> StaticAsset
+        self.cache_control = {} # request path -> Cache-Control header
+        self._load()
+
+    def _read(self, name):
+        with open(os.path.join(self.root, name), 'rb') as f:
+            return f.read()
+
+    def _load(self):
+        built = {}
+        for name, mimetype in ASSET_MANIFEST.items():
+            if name == ENTRY_POINT:
+                continue
+            asset = StaticAsset(name, self._read(name), mimetype)
+            built[name] = asset
+
+            # Fingerprinted URL never changes content, so browsers can keep it forever
+            self.assets[asset.fingerprinted_name] = asset
+            self.cache_control[asset.fingerprinted_name] = IMMUTABLE_CACHE
+            # Plain URL still works (old tabs, bookmarks) but must be revalidated
+            self.assets[name] = asset
+            self.cache_control[name] = REVALIDATE_CACHE
+
+        html = self._read(ENTRY_POINT).decode('utf-8')
+        for name, asset in built.items():
+            html = re.sub(
+                r'''((?:src|href)=["'])%s(["'])''' % re.escape(name),
+                r'\g<1>%s\g<2>' % asset.fingerprinted_name,
+                html,
+            )
+        index = StaticAsset(ENTRY_POINT, html.encode('utf-8'), ASSET_MANIFEST[ENTRY_POINT])
+        self.assets[ENTRY_POINT] = index
+        self.cache_control[ENTRY_POINT] = REVALIDATE_CACHE
+
+    def has(self, path):
+        return path in self.assets
+
+    def response(self, path):
+        """Build the response for a manifest path, or a 304 if the client copy is current."""
+        asset = self.assets[path]
+        encoding = asset.choose_encoding(request.headers.get('Accept-Encoding', ''))
+        etag = asset.etag_for(encoding)
+
+        headers = {
+            'ETag': etag,
+            'Cache-Control': self.cache_control[path],
+            'Vary': 'Accept-Encoding',
+        }
+
+        if _etag_matches(request.headers.get('If-None-Match'), etag):
+            return Response(status=304, headers=headers)
+
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+
+        # Werkzeug drops the body itself for HEAD requests
+        return Response(asset.variants[encoding], status=200, headers=headers,
+                        content_type=asset.mimetype)
+
+
+def _etag_matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False